@@ -30,6 +30,9 @@
 """
 
 import os
+from urllib.parse import urlsplit
+
+import botocore.exceptions
 
 class FileUtils:
     """
@@ -40,22 +43,34 @@ class FileUtils:
         """
         Extract the Bucket name and prefix object of the specified absolute S3 path.
         """
-        s3_path = s3_path.replace('\\', '/')
-        bucket_name = s3_path.split('//')[1].split('/')[0]
-        prefix_path = '/'.join(s3_path.split('//')[1].split('/')[1:])
-        return bucket_name, prefix_path
+        url = urlsplit(s3_path.replace('\\', '/'))
+        return url.netloc, url.path.lstrip('/')
         
+    @staticmethod
+    def list_s3_keys(s3, s3_folder, **kwargs):
+        """
+        Returns the set of object keys stored under the specified absolute S3 folder.
+        """
+        bucket_name, prefix_path = FileUtils.parse_s3_path(s3_folder)
+
+        s3_keys = set()
+        paginator = s3.get_paginator('list_objects_v2')
+        for s3_response in paginator.paginate(Bucket=bucket_name, Prefix=prefix_path, **kwargs):
+            for s3_object in s3_response.get('Contents', []):
+                s3_keys.add(s3_object.get('Key', ''))
+
+        return s3_keys
+
     @staticmethod
     def exist_s3_path(s3, s3_path, **kwargs):
         """
         Returns if one AWS S3 path/file exist.
         """
         bucket_name, prefix_path = FileUtils.parse_s3_path(s3_path)
-        
-        list_kwargs = dict(MaxKeys=1, Bucket=bucket_name, Prefix=prefix_path, **kwargs)
-        s3_response = s3.list_objects_v2(**list_kwargs)
-        s3_objects = s3_response.get('Contents', [])
-        for s3_object in s3_objects:
-            if s3_object.get('Key', '') == prefix_path: return True
-            
-        return False
+
+        try:
+            s3.head_object(Bucket=bucket_name, Key=prefix_path, **kwargs)
+            return True
+        except botocore.exceptions.ClientError as e:
+            if e.response['Error']['Code'] == '404': return False
+            raise
@@ -29,12 +29,16 @@
 ================================================================================
 """
 
+import concurrent.futures
 import json
 import os
 import numpy as np
 import boto3
+import botocore.config
 
+from numba import njit, prange
 from osgeo import gdal
+from osgeo import gdal_array
 from osgeo import ogr
 from osgeo import osr
 from osgeo_utils import OgrCommonUtils, GdalCommonUtils
@@ -45,32 +49,152 @@ gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', 'TRUE')
 gdal.SetConfigOption('CPL_CURL_VERBOSE', 'NO')
 gdal.SetConfigOption('CPL_DEBUG', 'NO')
 gdal.SetConfigOption('CPL_VSIL_CURL_ALLOWED_EXTENSIONS', '.tif')
+# Tune remote COG access: fewer and larger HTTP range requests, HTTP/2
+# multiplexing, multi-threaded tile decoding, and a bounded block cache to
+# keep the peak RSS of the Lambda container low.
+gdal.SetConfigOption('GDAL_HTTP_MERGE_CONSECUTIVE_RANGES', 'YES')
+gdal.SetConfigOption('CPL_VSIL_CURL_CHUNK_SIZE', '1048576')
+gdal.SetConfigOption('GDAL_INGESTED_BYTES_AT_OPEN', '32768')
+gdal.SetConfigOption('GDAL_HTTP_MULTIPLEX', 'YES')
+gdal.SetConfigOption('GDAL_HTTP_VERSION', '2')
+gdal.SetConfigOption('GDAL_NUM_THREADS', 'ALL_CPUS')
+gdal.SetConfigOption('GDAL_CACHEMAX', '256')
+# A bounded VSI cache keeps the COG headers and recently read blocks of the
+# /vsis3 LandUse dataset in memory across warm invocations.
+gdal.SetConfigOption('VSI_CACHE', 'TRUE')
+gdal.SetConfigOption('VSI_CACHE_SIZE', '134217728')
+gdal.SetConfigOption('AWS_REGION', os.environ.get('AWS_REGION', ''))
 
+# The S3 client is created once per Lambda container, warm invocations reuse
+# its HTTPS connection pool; the pool is sized for the parallel GetObject fan-out.
+_S3_CLIENT = boto3.client('s3', config=botocore.config.Config(
+    max_pool_connections=16, retries={'max_attempts': 3, 'mode': 'standard'}))
 
-def get_valid_sen2cor_cloud_mask(cm_raster, valid_classes=[2, 4, 5, 6, 7, 11]):
+# Environment settings never change during the life of a container, parse them once.
+_LU_DATASET_PATH = os.environ['LANDUSE_DATASET_S3_PATH']
+_OUTPUT_FOLDER = os.environ['OUTPUT_S3_FOLDER']
+# Overlapping grid names with my input Dataset.
+# https://sentinel.esa.int/web/sentinel/missions/sentinel-2/data-products
+_GRID_NAMES = tuple(os.environ['S2L2A_TILES'].split(','))
+
+# Spatial references and transformations are built once per Lambda container,
+# warm invocations reuse them instead of re-parsing the PROJ definitions.
+_GEOG_CRS = osr.SpatialReference()
+_GEOG_CRS.ImportFromEPSG(4326)
+_GRID_CRS_BY_EPSG = {}
+_TRANSFORM_BY_EPSG = {}
+
+
+def _get_grid_crs(epsg_code):
+    """
+    Returns the cached SpatialReference of the specified EPSG code.
+    """
+    grid_crs = _GRID_CRS_BY_EPSG.get(epsg_code)
+    if grid_crs is None:
+        grid_crs = osr.SpatialReference()
+        grid_crs.ImportFromEPSG(epsg_code)
+        _GRID_CRS_BY_EPSG[epsg_code] = grid_crs
+    return grid_crs
+
+
+def _get_transform(epsg_code):
+    """
+    Returns the cached CoordinateTransformation from EPSG:4326 to the specified EPSG code.
+    """
+    transform = _TRANSFORM_BY_EPSG.get(epsg_code)
+    if transform is None:
+        transform = osr.CoordinateTransformation(_GEOG_CRS, _get_grid_crs(epsg_code))
+        _TRANSFORM_BY_EPSG[epsg_code] = transform
+    return transform
+
+
+# The LandUse dataset rarely changes; keep the opened handle across warm
+# invocations so the COG header is fetched and parsed once per container.
+_LU_DATASET_CACHE = {}
+
+
+def _get_landuse_dataset(object_path):
+    """
+    Returns the cached GDAL dataset of the specified LandUse object path.
+    """
+    lu_dataset = _LU_DATASET_CACHE.get(object_path)
+    if lu_dataset is None:
+        if _LU_DATASET_CACHE:
+            _LU_DATASET_CACHE.clear()
+            gdal.VSICurlClearCache()
+        lu_dataset = gdal.Open(object_path, gdal.GA_ReadOnly)
+        _LU_DATASET_CACHE[object_path] = lu_dataset
+    return lu_dataset
+
+
+# Lookup tables indexed by class code, rasters are 8-bit so one gather replaces
+# one full comparison pass per class code.
+_SCL_VALID_LUT = np.zeros(256, dtype=np.uint8)
+_SCL_VALID_LUT[[2, 4, 5, 6, 7, 11]] = 1
+_SIGPAC_URBAN_LUT = np.zeros(256, dtype=np.uint8)
+_SIGPAC_URBAN_LUT[[0, 5]] = 1
+
+
+def get_valid_mask(raster, valid_classes):
+    """
+    Returns the mask of pixels whose value belongs to the specified class codes.
+    """
+    return np.isin(raster, np.asarray(valid_classes, dtype=raster.dtype))
+
+
+def get_valid_sen2cor_cloud_mask(cm_raster):
     """
     Returns the valid sen2cor SCL mask (SCL: 2,4,5,6,7,11 are valid, otherwise are cloudy).
     """
-    scl_mask = np.zeros_like(cm_raster, dtype=np.bool)
-    for code in valid_classes: scl_mask = np.logical_or(scl_mask, (cm_raster == code).astype(np.bool))
-    return scl_mask
+    if cm_raster.dtype != np.uint8: return get_valid_mask(cm_raster, [2, 4, 5, 6, 7, 11]).view(np.uint8)
+    return _SCL_VALID_LUT[cm_raster]
 
 
-def get_valid_sigpac_urban_mask(lu_raster, valid_classes=[0, 5]):
+def get_valid_sigpac_urban_mask(lu_raster):
     """
     Returns the valid Urban-type mask (SIGPAC: 0,5 are urban-type polygons).
     """
-    lu_mask = np.zeros_like(lu_raster, dtype=np.bool)
-    for code in valid_classes: lu_mask = np.logical_or(lu_mask, (lu_raster == code).astype(np.bool))
-    return lu_mask
+    if lu_raster.dtype != np.uint8: return get_valid_mask(lu_raster, [0, 5]).view(np.uint8)
+    return _SIGPAC_URBAN_LUT[lu_raster]
+
+
+@njit(parallel=True, cache=True)
+def compute_rs(cm_mask, lu_mask, gm_raster, rs_raster):
+    """
+    Fills the result raster (0=outside, 1=urban, 2=valid urban) in a single pass
+    from the precomputed class masks and returns the count of urban and valid
+    urban pixels. Masks are computed outside with the dtype-safe helpers, the
+    kernel runs with bounds checking off and must not index by raw pixel values.
+    """
+    count_of_urban_pixels = 0
+    count_of_valid_urban_pixels = 0
+
+    for i in prange(cm_mask.shape[0]):
+        for j in range(cm_mask.shape[1]):
+            if lu_mask[i, j] and gm_raster[i, j] == 1:
+                count_of_urban_pixels += 1
+                if cm_mask[i, j]:
+                    rs_raster[i, j] = 2
+                    count_of_valid_urban_pixels += 1
+                else:
+                    rs_raster[i, j] = 1
+            else:
+                rs_raster[i, j] = 0
+
+    return count_of_urban_pixels, count_of_valid_urban_pixels
 
 
 def print_statistics(label, array):
     """
     Print some statistics of the specified numpy array.
     """
-    unique_vals = np.unique(array)
-    unique_count = [np.count_nonzero(array == v) for v in unique_vals]
+    # bincount allocates max+1 counters, only use it for small-range codes.
+    if np.issubdtype(array.dtype, np.integer) and array.min() >= 0 and array.max() < 65536:
+        counts = np.bincount(array.ravel())
+        unique_vals = np.nonzero(counts)[0]
+        unique_count = counts[unique_vals]
+    else:
+        unique_vals, unique_count = np.unique(array, return_counts=True)
     percentages = [100.0 * (v / array.size) for v in unique_count]
     print('INFO: {}: shape={} size={} min={} max={} unique={} count={} %={}'.format(label, array.shape, array.size, array.min(), array.max(), unique_vals, unique_count, percentages))
 
@@ -81,13 +205,6 @@ def lambda_handler(event, context):
     #print('GDAL_VERSION={}'.format(gdal.VersionInfo()))
     #print('EventObj={}'.format(json.dumps(event)))
     
-    # Get environment settings.
-    lu_dataset_path = os.environ['LANDUSE_DATASET_S3_PATH']
-    output_folder = os.environ['OUTPUT_S3_FOLDER']
-    # Get overlapping grid names with my input Dataset.
-    # https://sentinel.esa.int/web/sentinel/missions/sentinel-2/data-products
-    grid_names = os.environ['S2L2A_TILES'].split(',')
-    
     # Get Metadata of current Product.
     message_obj = json.loads(event['Records'][0]['Sns']['Message'])
     item_id = message_obj['id']
@@ -103,11 +220,8 @@ def lambda_handler(event, context):
     cloud_cover = properties['eo:cloud_cover']
     print('INFO: ProductId={}, ItemId={}, Platform={}, GridName={}{}{}, Date={}, CloudCover={}'.format(product_id, item_id, platform, utm_zone, latitude, grid_square, product_date, cloud_cover))
     
-    geog_crs = osr.SpatialReference()
-    geog_crs.ImportFromEPSG(4326)
-    grid_crs = osr.SpatialReference()
-    grid_crs.ImportFromEPSG(32630)
-    transform = osr.CoordinateTransformation(geog_crs, grid_crs)
+    grid_crs = _get_grid_crs(32630)
+    transform = _get_transform(32630)
     
     geometry_as_text = str(message_obj['geometry'])
     geometry = ogr.CreateGeometryFromJson(geometry_as_text)
@@ -126,9 +240,9 @@ def lambda_handler(event, context):
     cm_band = None
     
     # Open the LandUse Dataset.
-    lu_object_path = lu_dataset_path.replace('s3://', '/vsis3/')
+    lu_object_path = _LU_DATASET_PATH.replace('s3://', '/vsis3/')
     print('INFO: LandUse ObjectPath={}'.format(lu_object_path))
-    lu_dataset = gdal.Open(lu_object_path, gdal.GA_ReadOnly)
+    lu_dataset = _get_landuse_dataset(lu_object_path)
     lu_extent = GdalCommonUtils.get_envelope(lu_dataset)
     lu_geometry = OgrCommonUtils.create_geometry_from_bbox(lu_extent[0], lu_extent[1], lu_extent[2], lu_extent[3])
     lu_band = lu_dataset.GetRasterBand(1)
@@ -142,26 +256,49 @@ def lambda_handler(event, context):
             'body': json.dumps('Input data do not intersect')
         }
         
-    s3 = boto3.client('s3')
-    
+    s3 = _S3_CLIENT
+
+    # List all already processed items with one paginated request,
+    # instead of issuing one existence check per candidate grid name.
+    existing_keys = FileUtils.list_s3_keys(s3, _OUTPUT_FOLDER)
+
     # Calculate geometry of AOI...
     aoi_geometry = cm_geometry.Intersection(lu_geometry)
     # ... subtracting geometries of already processed tiles, we do not want to process pixels twice.
-    for grid_name in grid_names:
+    items_to_fetch = []
+    for grid_name in _GRID_NAMES:
         item_name = item_id[0:4] + grid_name + item_id[9:]
-        item_path = os.path.join(output_folder, item_name + '.json')
-        print(' + ItemName={}, Exist={} Current={}'.format(item_name, FileUtils.exist_s3_path(s3, item_path), item_name==item_id))
-        
-        if item_name != item_id and FileUtils.exist_s3_path(s3, item_path):
-            bucket_name, prefix_path = FileUtils.parse_s3_path(item_path)
-            s3_response = s3.get_object(Bucket = bucket_name, Key = prefix_path)
-            s3_content = s3_response['Body']
-            item_obj = json.loads(s3_content.read())
-            temp_env = item_obj['land_use']['aoi_extent']
-            geom_obj = OgrCommonUtils.create_geometry_from_bbox(temp_env[0], temp_env[1], temp_env[2], temp_env[3])
-            #print(' - ItemObjt={}'.format(json.dumps(item_obj)))
-            if aoi_geometry.Intersects(geom_obj): aoi_geometry = aoi_geometry.Difference(geom_obj)
-            
+        item_path = os.path.join(_OUTPUT_FOLDER, item_name + '.json')
+        bucket_name, prefix_path = FileUtils.parse_s3_path(item_path)
+        print(' + ItemName={}, Exist={} Current={}'.format(item_name, prefix_path in existing_keys, item_name==item_id))
+
+        if item_name != item_id and prefix_path in existing_keys:
+            items_to_fetch.append((bucket_name, prefix_path))
+
+    # Fetch the metadata of already processed tiles in parallel, these are
+    # independent network I/Os. The geometry operations stay sequential below,
+    # OGR is not thread-safe.
+    def fetch_item_obj(bucket_and_key):
+        s3_response = s3.get_object(Bucket = bucket_and_key[0], Key = bucket_and_key[1])
+        return json.loads(s3_response['Body'].read())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        item_objs = list(executor.map(fetch_item_obj, items_to_fetch))
+
+    for item_obj in item_objs:
+        temp_env = item_obj['land_use']['aoi_extent']
+        geom_obj = OgrCommonUtils.create_geometry_from_bbox(temp_env[0], temp_env[1], temp_env[2], temp_env[3])
+        #print(' - ItemObjt={}'.format(json.dumps(item_obj)))
+        if aoi_geometry.Intersects(geom_obj): aoi_geometry = aoi_geometry.Difference(geom_obj)
+
+    # All overlapping pixels may already be covered by previously processed
+    # tiles; skip the raster downloads entirely in that case.
+    if aoi_geometry is None or aoi_geometry.IsEmpty() or aoi_geometry.GetArea() <= 0:
+        return {
+            'statusCode': 200,
+            'body': json.dumps('Empty AOI')
+        }
+
     temp_x_min, temp_x_max, temp_y_min, temp_y_max = aoi_geometry.GetEnvelope()
     aoi_x_min = max(temp_x_min, lu_extent[0])
     aoi_y_min = max(temp_y_min, lu_extent[1])
@@ -170,74 +307,90 @@ def lambda_handler(event, context):
     aoi_extent = [aoi_x_min, aoi_y_min, aoi_x_max, aoi_y_max]
     print('INFO: IOU Envelope={}'.format(aoi_extent))
     
-    # Get raster data from input Datasets.
-    left, top, right, bottom = GdalCommonUtils.get_reading_window(cm_dataset, aoi_extent)
-    print(' + CloudMask Dataset Window=({},{},{},{}) Size=({},{})'.format(left, top, right, bottom, right-left, bottom-top))
-    cm_band = cm_dataset.GetRasterBand(1)
-    cm_no_data = cm_band.GetNoDataValue()
-    cm_raster = cm_band.ReadAsArray(xoff=left, yoff=top, win_xsize=right-left, win_ysize=bottom-top)
-    cm_band = None
-    left, top, right, bottom = GdalCommonUtils.get_reading_window(lu_dataset, aoi_extent)
-    print(' + LandUse Dataset Window=({},{},{},{}) Size=({},{})'.format(left, top, right, bottom, right-left, bottom-top))
-    lu_band = lu_dataset.GetRasterBand(1)
-    lu_no_data = lu_band.GetNoDataValue()
-    lu_raster = lu_band.ReadAsArray(xoff=left, yoff=top, win_xsize=right-left, win_ysize=bottom-top)
-    lu_band = None
-    
+    # Get raster data windows of input Datasets.
+    cm_left, cm_top, cm_right, cm_bottom = GdalCommonUtils.get_reading_window(cm_dataset, aoi_extent)
+    print(' + CloudMask Dataset Window=({},{},{},{}) Size=({},{})'.format(cm_left, cm_top, cm_right, cm_bottom, cm_right-cm_left, cm_bottom-cm_top))
+    lu_left, lu_top, lu_right, lu_bottom = GdalCommonUtils.get_reading_window(lu_dataset, aoi_extent)
+    print(' + LandUse Dataset Window=({},{},{},{}) Size=({},{})'.format(lu_left, lu_top, lu_right, lu_bottom, lu_right-lu_left, lu_bottom-lu_top))
+    window_size_x = cm_right - cm_left
+    window_size_y = cm_bottom - cm_top
+
     num_decimals = 10 if grid_crs.IsGeographic() else 5
     resolution_x = round((cm_extent[2] - cm_extent[0]) / float(cm_dataset.RasterXSize), num_decimals)
     resolution_y = round((cm_extent[3] - cm_extent[1]) / float(cm_dataset.RasterYSize), num_decimals)
     print(' + NumDecimals={} Resolution=({}, {})'.format(num_decimals, resolution_x, resolution_y))
-    
+
+    cm_band = cm_dataset.GetRasterBand(1)
+    cm_no_data = cm_band.GetNoDataValue()
+    lu_band = lu_dataset.GetRasterBand(1)
+    lu_no_data = lu_band.GetNoDataValue()
+    gm_no_data = 0
+
+    # Merge valid pixels from both input raster data, streaming the AOI window
+    # in tiles so no full-raster array is ever materialized; the fused kernel
+    # accumulates the pixel counts on the fly.
+    tile_size = 1024
+    count_of_urban_pixels = 0
+    count_of_valid_urban_pixels = 0
+
+    for tile_y in range(0, window_size_y, tile_size):
+        tile_size_y = min(tile_size, window_size_y - tile_y)
+
+        for tile_x in range(0, window_size_x, tile_size):
+            tile_size_x = min(tile_size, window_size_x - tile_x)
+
+            cm_raster = cm_band.ReadAsArray(xoff=cm_left+tile_x, yoff=cm_top+tile_y, win_xsize=tile_size_x, win_ysize=tile_size_y)
+
+            # The LandUse window is rounded independently of the CloudMask one
+            # and can be one pixel smaller; clamp the read to the raster bounds,
+            # pixels beyond the edge are not urban.
+            lu_read_size_x = min(tile_size_x, lu_dataset.RasterXSize - lu_left - tile_x)
+            lu_read_size_y = min(tile_size_y, lu_dataset.RasterYSize - lu_top - tile_y)
+            if lu_read_size_x <= 0 or lu_read_size_y <= 0: continue
+            lu_raster = lu_band.ReadAsArray(xoff=lu_left+tile_x, yoff=lu_top+tile_y, win_xsize=lu_read_size_x, win_ysize=lu_read_size_y)
+
+            # Tiles without any urban class cannot contribute to the counts,
+            # skip the geometry rasterization and the kernel for them. The
+            # helper handles any LandUse dtype, e.g. int16 rasters with a
+            # negative nodata value that cannot index the 256-entry table.
+            lu_mask = get_valid_sigpac_urban_mask(lu_raster)
+            if lu_mask.shape != (tile_size_y, tile_size_x):
+                lu_padded = np.zeros((tile_size_y, tile_size_x), dtype=lu_mask.dtype)
+                lu_padded[:lu_read_size_y, :lu_read_size_x] = lu_mask
+                lu_mask = lu_padded
+            if not lu_mask.any(): continue
+
+            # Rasterize Geometry of input valid CloudMask straight into a numpy
+            # buffer, the MEM dataset just wraps it so no ReadAsArray copy is needed.
+            gm_raster = np.zeros((tile_size_y, tile_size_x), dtype=np.uint8)
+            gm_dataset = gdal_array.OpenArray(gm_raster)
+            gm_dataset.SetProjection(grid_crs.ExportToWkt())
+            gm_dataset.SetGeoTransform([aoi_extent[0] + tile_x * resolution_x, resolution_x, 0.0, aoi_extent[3] - tile_y * resolution_y, 0.0, -resolution_y])
+            gm_dataset.GetRasterBand(1).SetNoDataValue(gm_no_data)
+            GdalCommonUtils.rasterize_geometries(gm_dataset, grid_crs, ogr.wkbPolygon, [geometry])
+            gm_dataset = None
+
+            cm_mask = get_valid_sen2cor_cloud_mask(cm_raster)
+            rs_raster = np.zeros(cm_raster.shape, dtype=np.uint8)
+            tile_urban_pixels, tile_valid_urban_pixels = \
+                compute_rs(cm_mask, lu_mask, gm_raster, rs_raster)
+            count_of_urban_pixels += tile_urban_pixels
+            count_of_valid_urban_pixels += tile_valid_urban_pixels
+
+            #print_statistics('rs_raster', rs_raster)
+
     # Clean resources.
+    cm_band = None
+    lu_band = None
     cm_dataset = None
     lu_dataset = None
-    
-    # Merge valid pixels from both input raster data.
-    cm_raster = get_valid_sen2cor_cloud_mask(cm_raster)
-    cm_raster = cm_raster.astype(np.int)
-    lu_raster = get_valid_sigpac_urban_mask(lu_raster)
-    lu_raster = lu_raster.astype(np.int)
-    rs_raster = np.copy(lu_raster)
-    valid_mask = ((cm_raster > 0) & (lu_raster > 0))
-    rs_raster[valid_mask] = 2
-    
-    #print_statistics('cm_raster', cm_raster)
-    #print_statistics('lu_raster', lu_raster)
-    #print_statistics('rs_raster', rs_raster)
-    
-    # Clean resources.
-    del cm_raster
-    del lu_raster
-    
-    gm_raster_size_x = int((aoi_extent[2] - aoi_extent[0]) / resolution_x)
-    gm_raster_size_y = int((aoi_extent[3] - aoi_extent[1]) / resolution_y)
-    gm_no_data = 0
-    
-    # Rasterize Geometry of input valid CloudMask, we will mask with current result.
-    driver = gdal.GetDriverByName('MEM')
-    gm_dataset = driver.Create('', gm_raster_size_x, gm_raster_size_y, 1, gdal.GDT_Byte)
-    gm_dataset.SetProjection(grid_crs.ExportToWkt())
-    gm_dataset.SetGeoTransform([aoi_extent[0], resolution_x, 0.0, aoi_extent[3], 0.0, -resolution_y])
-    gm_dataset.GetRasterBand(1).SetNoDataValue(gm_no_data)
-    gm_dataset.FlushCache()
-    GdalCommonUtils.rasterize_geometries(gm_dataset, grid_crs, ogr.wkbPolygon, [geometry])
-    gm_dataset.FlushCache()
-    gm_band = gm_dataset.GetRasterBand(1)
-    gm_raster = gm_band.ReadAsArray()
-    gm_band = None
-    gm_dataset = None
-    
-    #print_statistics('gm_raster', gm_raster)
-    
-    # Calculate final results and save data.
-    valid_mask = (gm_raster == 1)
-    rs_raster[~valid_mask] = 0
-    del gm_raster
-    count_of_valid_urban_pixels = np.count_nonzero(rs_raster == 2)
-    count_of_urban_pixels = np.count_nonzero(rs_raster > 0)
-    del rs_raster
-    urban_cover = (100.0 * count_of_valid_urban_pixels) / count_of_urban_pixels
+
+    # No urban pixels in the AOI is a valid result, do not fail with a
+    # ZeroDivisionError that would only trigger a Lambda retry.
+    if count_of_urban_pixels > 0:
+        urban_cover = (100.0 * count_of_valid_urban_pixels) / count_of_urban_pixels
+    else:
+        urban_cover = 0.0
     print('INFO: Urban pixels={}, Valid Urban pixels={}, Urban cover={}'.format(count_of_urban_pixels, count_of_valid_urban_pixels, urban_cover))
     
     message_obj['land_use'] = { 
@@ -248,12 +401,8 @@ def lambda_handler(event, context):
     }
     
     # Save updated metadata of current STAC item to our Bucket.
-    temp_file = '/tmp/{}.json'.format(item_id)
-    with open(temp_file, 'w', encoding='utf-8') as fp:
-        json.dump(message_obj, fp)
-        
-    bucket_name, prefix_path = FileUtils.parse_s3_path(os.path.join(output_folder, item_id + '.json'))
-    s3.upload_file(temp_file, bucket_name, prefix_path)
+    bucket_name, prefix_path = FileUtils.parse_s3_path(os.path.join(_OUTPUT_FOLDER, item_id + '.json'))
+    s3.put_object(Bucket=bucket_name, Key=prefix_path, Body=json.dumps(message_obj, default=str).encode('utf-8'), ContentType='application/json')
     
     return {
         'statusCode': 200,
@@ -108,30 +108,39 @@ class GdalCommonUtils:
     @staticmethod
     def rasterize_geometries(dataset, spatial_ref, geometry_type, geometries):
         """
-        Rasterize the specified geometries to a GDAL dataset.
+        Rasterize the specified geometries to a GDAL dataset (burn value = 1).
         """
-        attribute_name = 'my_field'
-        f_count = 0
-        
+        if len(geometries) == 1 and spatial_ref.GetAuthorityCode(None) is not None:
+            # Single geometry with an identifiable CRS, rasterize straight from a
+            # GeoJSON blob in /vsimem, skipping the temporary Feature Layer and
+            # the geometry copy. Without an authority code the GeoJSON driver
+            # would assume CRS84 and burn nothing, so fall through below instead.
+            authority = '{}:{}'.format(spatial_ref.GetAuthorityName(None), spatial_ref.GetAuthorityCode(None))
+            geojson_text = \
+                '{{"type": "FeatureCollection", ' \
+                '"crs": {{"type": "name", "properties": {{"name": "{}"}}}}, ' \
+                '"features": [{{"type": "Feature", "properties": {{}}, "geometry": {}}}]}}' \
+                .format(authority, geometries[0].ExportToJson())
+
+            geojson_path = '/vsimem/rasterize_geometries.geojson'
+            gdal.FileFromMemBuffer(geojson_path, geojson_text)
+            gdal.Rasterize(dataset, geojson_path, burnValues=[1], allTouched=False)
+            gdal.Unlink(geojson_path)
+            return dataset
+
         temp_store = ogr.GetDriverByName('Memory').CreateDataSource('wrk')
         temp_layer = temp_store.CreateLayer('temp', spatial_ref, geometry_type)
-        temp_field = ogr.FieldDefn(attribute_name, ogr.OFTInteger)
-        temp_layer.CreateField(temp_field)
         schema_def = temp_layer.GetLayerDefn()
-        
+
         # Saving the geometries of interest to a temporary Feature Layer to rasterize.
         for geometry in geometries:
             feature = ogr.Feature(schema_def)
-            feature.SetField(attribute_name, 1)
-            feature.SetGeometry(geometry.Clone())
+            feature.SetGeometry(geometry)
             temp_layer.CreateFeature(feature)
             feature = None
-            f_count = f_count + 1
 
-        # Render Features!
-        errcode = gdal.RasterizeLayer(dataset, [1], temp_layer, options=['ATTRIBUTE={}'.format(attribute_name)])
-        dataset.FlushCache()
-        temp_field = None
+        # Render Features! A constant burn value avoids the per-feature attribute lookup.
+        errcode = gdal.RasterizeLayer(dataset, [1], temp_layer, burn_values=[1])
         schema_def = None
         temp_layer = None
         temp_store = None